@@ -8,7 +8,12 @@ Run with: streamlit run lp_web_app.py
 import streamlit as st
 import pandas as pd
 import numpy as np
-from pulp import LpMaximize, LpMinimize, LpProblem, LpVariable, lpSum, value
+from pulp import (
+    LpMaximize, LpMinimize, LpProblem, LpVariable, lpDot, value, PULP_CBC_CMD,
+    LpStatus, LpStatusNotSolved, LpStatusOptimal, LpStatusInfeasible, LpStatusUnbounded, LpStatusUndefined
+)
+from scipy.optimize import linprog
+from scipy.sparse import csc_matrix
 import plotly.graph_objects as go
 import plotly.express as px
 
@@ -21,7 +26,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+CUSTOM_CSS = """
     <style>
     .main-header {
         font-size: 2.5rem;
@@ -62,7 +67,522 @@ st.markdown("""
         margin: 1rem 0;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+# Streamlit drops elements that a rerun does not emit, so the stylesheet is sent on every run
+st.html(CUSTOM_CSS)
+
+
+# Map scipy.optimize.linprog status codes onto PuLP's status codes
+LINPROG_STATUS = {
+    0: LpStatusOptimal,
+    1: LpStatusNotSolved,  # iteration or time limit reached
+    2: LpStatusInfeasible,
+    3: LpStatusUnbounded,
+    4: LpStatusUndefined   # numerical difficulties
+}
+
+# Default table contents for the sidebar example problems (None = blank problem)
+EXAMPLES = {
+    "wyndor": {
+        "product_names": ["Doors", "Windows"],
+        "profits": [300, 500],
+        "default_profit": 100.0,
+        "resource_names": ["Plant_1", "Plant_2", "Plant_3"],
+        "available": [4, 12, 18],
+        "usage": [
+            [1.0, 0.0],  # Plant 1
+            [0.0, 2.0],  # Plant 2
+            [3.0, 2.0]   # Plant 3
+        ]
+    },
+    "bakery": {
+        "product_names": ["Cookies", "Cakes"],
+        "profits": [2, 8],
+        "default_profit": 10.0,
+        "resource_names": ["Oven_Time", "Mixing_Time", "Ingredients"],
+        "available": [40, 30, 50],
+        "usage": [
+            [0.5, 2.0],    # Oven
+            [0.3, 1.0],    # Mixing
+            [0.2, 1.5]     # Ingredients
+        ]
+    },
+    None: {
+        "product_names": [],
+        "profits": [],
+        "default_profit": 100.0,
+        "resource_names": [],
+        "available": [],
+        "usage": []
+    }
+}
+
+# Usage matrices with more cells than this are passed to HiGHS in sparse form
+SPARSE_THRESHOLD = 50 * 50
+
+
+# Helper functions
+def seed_table(defaults, previous, columns):
+    """Overlay the previously edited table onto the defaults, matching cells by position."""
+    if previous is None:
+        return defaults
+    seeded = defaults.copy()
+    seeded.update(previous.reindex(columns=columns))
+    return seeded
+
+
+def default_coefficient(defaults, i, is_max):
+    """Default profit (maximize) or cost (minimize) per unit for the i-th product."""
+    if not is_max:
+        return 50.0
+    return float(defaults["profits"][i]) if i < len(defaults["profits"]) else defaults["default_profit"]
+
+
+def freeze_config(config):
+    """Convert the problem configuration into a hashable tuple for caching."""
+    return (
+        config["problem_name"],
+        config["objective"],
+        config["variable_type"],
+        config["solver"],
+        config["product_names"],
+        tuple(config["profit_vec"].tolist()),
+        config["resource_names"],
+        tuple(resource_data["available"] for resource_data in config["resources"].values()),
+        tuple(map(tuple, config["usage_matrix"].tolist()))
+    )
+
+
+def solve_with_linprog(objective_sense, variable_type, resource_names, profit_array, usage_matrix, avail_vec):
+    """Solve the LP in-process with SciPy's HiGHS interface."""
+    # linprog always minimizes, so negate the objective for maximization
+    c = -profit_array if objective_sense == "maximize" else profit_array
+    A_ub = csc_matrix(usage_matrix) if usage_matrix.size > SPARSE_THRESHOLD else usage_matrix
+    integrality = np.ones(len(c), dtype=int) if variable_type == "Integer" else None
+    
+    bounds = [(0, None)] * len(c)
+    res = linprog(c, A_ub=A_ub, b_ub=avail_vec, bounds=bounds, method="highs", integrality=integrality)
+    res_status = res.status
+    if res_status == 4 and integrality is not None:
+        # HiGHS reports integer problems as "unbounded or infeasible"; the LP relaxation tells them apart
+        relaxed = linprog(c, A_ub=A_ub, b_ub=avail_vec, bounds=bounds, method="highs")
+        if relaxed.status in (2, 3):
+            res_status = relaxed.status
+    status = LINPROG_STATUS.get(res_status, LpStatusUndefined)
+    if status != LpStatusOptimal:
+        return status, None, None, {}
+    
+    # Adding 0.0 turns the -0.0 from negating a zero objective into 0.0
+    objective_value = (-res.fun if objective_sense == "maximize" else res.fun) + 0.0
+    
+    # Duals are only reported for continuous problems
+    ineqlin = res.ineqlin
+    if integrality is not None or ineqlin.marginals is None:
+        marginals = np.zeros(len(resource_names))
+    else:
+        marginals = -ineqlin.marginals if objective_sense == "maximize" else ineqlin.marginals
+    shadow_prices = dict(zip(resource_names, marginals.tolist()))
+    
+    return status, res.x, objective_value, shadow_prices
+
+
+def solve_with_pulp(problem_name, objective_sense, variable_type, product_names, resource_names,
+                    profit_array, usage_matrix, avail_vec):
+    """Build the LP as a PuLP model and solve it with CBC."""
+    # Create problem
+    if objective_sense == "maximize":
+        problem = LpProblem(problem_name, LpMaximize)
+    else:
+        problem = LpProblem(problem_name, LpMinimize)
+    
+    # Create variables
+    variables = {}
+    for product_name in product_names:
+        variables[product_name] = LpVariable(
+            product_name.replace(" ", "_"),
+            lowBound=0,
+            cat=variable_type
+        )
+    var_array = [variables[product] for product in product_names]
+    
+    # Objective function
+    problem += lpDot(profit_array.tolist(), var_array), "Objective"
+    
+    # Constraints
+    for i, resource_name in enumerate(resource_names):
+        problem += lpDot(usage_matrix[i].tolist(), var_array) <= avail_vec[i], resource_name
+    
+    # Solve
+    status = problem.solve(PULP_CBC_CMD(msg=False, threads=1))
+    if status != LpStatusOptimal:
+        return status, None, None, {}
+    
+    # CBC leaves variables that appear in no constraint or objective term unset; they are zero
+    x = np.fromiter((var.varValue or 0.0 for var in var_array), dtype=np.float64, count=len(var_array))
+    
+    # CBC can leave pi unset on some versions; report those duals as zero
+    constraints = problem.constraints
+    shadow_prices = dict(zip(
+        constraints.keys(),
+        (0.0 if constraint.pi is None else constraint.pi for constraint in constraints.values())
+    ))
+    
+    # An all-zero objective has no value in PuLP
+    objective_value = value(problem.objective)
+    return status, x, 0.0 if objective_value is None else objective_value, shadow_prices
+
+
+@st.cache_resource(max_entries=32)
+def build_and_solve(config_frozen):
+    """Solve the LP described by a frozen configuration and return the solution dict."""
+    (problem_name, objective_sense, variable_type, solver_name,
+     product_names, profits, resource_names, available_amounts, usage_rows) = config_frozen
+    usage_matrix = np.array(usage_rows, dtype=np.float64).reshape(len(resource_names), len(product_names))
+    profit_array = np.array(profits, dtype=np.float64)
+    avail_vec = np.array(available_amounts, dtype=np.float64)
+    
+    # Solve
+    if solver_name == "HiGHS":
+        status, x, objective_value, shadow_prices = solve_with_linprog(
+            objective_sense, variable_type, resource_names, profit_array, usage_matrix, avail_vec
+        )
+    else:
+        status, x, objective_value, shadow_prices = solve_with_pulp(
+            problem_name, objective_sense, variable_type, product_names, resource_names,
+            profit_array, usage_matrix, avail_vec
+        )
+    
+    # Store results
+    solution = {
+        "status": status,
+        "status_text": LpStatus[status],
+        "variables": {},
+        "objective_value": None,
+        "resource_usage": {},
+        "shadow_prices": {},
+        "profit_vec": profit_array,
+        "problem_name": problem_name,
+        "objective": objective_sense
+    }
+    
+    if status == LpStatusOptimal:
+        solution["variables"] = dict(zip(product_names, x.tolist()))
+        solution["objective_value"] = objective_value
+        
+        used_vec = usage_matrix @ x
+        slack_vec = avail_vec - used_vec
+        binding_vec = np.abs(slack_vec) < 1e-3
+        
+        solution["resource_usage"] = {
+            resource_name: {
+                "used": used,
+                "available": available,
+                "slack": slack,
+                "binding": binding
+            }
+            for resource_name, used, available, slack, binding in zip(
+                resource_names, used_vec.tolist(), avail_vec.tolist(), slack_vec.tolist(), binding_vec.tolist()
+            )
+        }
+        solution["shadow_prices"] = shadow_prices
+    
+    return solution
+
+
+@st.cache_data(max_entries=32)
+def make_production_fig(prod_df):
+    """Bar chart of the optimal production quantities."""
+    return px.bar(
+        prod_df,
+        x="Product",
+        y="Quantity",
+        title="Production Quantities by Product",
+        labels={"Quantity": "Units to Produce"},
+        color="Quantity",
+        color_continuous_scale="Blues"
+    )
+
+
+@st.cache_data(max_entries=32)
+def make_utilization_fig(util_df):
+    """Stacked bar chart of used vs. slack amount per resource."""
+    return px.bar(
+        util_df,
+        x="Resource",
+        y="Amount",
+        color="Type",
+        title="Resource Utilization: Used vs. Slack",
+        barmode="stack",
+        color_discrete_map={"Used": "#1f77b4", "Available": "#d3d3d3"}
+    )
+
+
+@st.cache_data(max_entries=32)
+def build_report(config_tuple, sol_tuple):
+    """Build the plain-text solution report from hashable config/solution projections."""
+    problem_name, objective_sense = config_tuple
+    status_text, variable_items, objective_value, resource_items, shadow_items = sol_tuple
+    maximize = objective_sense == "maximize"
+    
+    lines = [
+        "",
+        "LINEAR PROGRAMMING SOLUTION REPORT",
+        "=" * 60,
+        "",
+        f"Problem: {problem_name}",
+        f"Objective: {objective_sense.capitalize()} {'Profit' if maximize else 'Cost'}",
+        f"Status: {status_text}",
+        "",
+        "OPTIMAL PRODUCTION PLAN:",
+        "-" * 60
+    ]
+    lines.extend(f"{prod}: {qty:.2f} units" for prod, qty in variable_items)
+    
+    lines.extend(["", f"OPTIMAL {'PROFIT' if maximize else 'COST'}: ${objective_value:,.2f}"])
+    
+    lines.extend(["", "RESOURCE UTILIZATION:", "-" * 60])
+    lines.extend(
+        f"{res}: {used:.2f} / {available:.2f} (Slack: {slack:.2f}) {'[BINDING]' if binding else ''}"
+        for res, used, available, slack, binding in resource_items
+    )
+    
+    lines.extend(["", "SHADOW PRICES:", "-" * 60])
+    lines.extend(f"{res}: ${price:.2f} per unit" for res, price in shadow_items if abs(price) > 0.01)
+    
+    return "\n".join(lines) + "\n"
+
+
+@st.fragment
+def render_results(sol):
+    """Render the Results tab for a stored solution."""
+    # Status
+    if sol["status"] == LpStatusOptimal:
+        st.markdown(f'<div class="success-box"><strong>✅ Status:</strong> {sol["status_text"]} Solution Found!</div>', unsafe_allow_html=True)
+    else:
+        st.markdown(f'<div class="warning-box"><strong>⚠️ Status:</strong> {sol["status_text"]}</div>', unsafe_allow_html=True)
+        if sol["status"] == LpStatusInfeasible:
+            st.error("The problem is **INFEASIBLE**. This means the constraints are too restrictive and no solution exists that satisfies all constraints.")
+        elif sol["status"] == LpStatusUnbounded:
+            st.error("The problem is **UNBOUNDED**. This means the objective function can grow infinitely. Check that all necessary constraints are included.")
+    
+    if sol["status"] == LpStatusOptimal:
+        # Optimal production plan
+        st.markdown("### 🎯 Optimal Production Plan")
+        
+        prod_df = pd.DataFrame({
+            "Product": list(sol["variables"].keys()),
+            "Quantity": np.fromiter(sol["variables"].values(), dtype=np.float64),
+            "Unit Value": sol["profit_vec"]
+        })
+        st.dataframe(
+            prod_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={"Unit Value": st.column_config.NumberColumn(format="$%.2f")}
+        )
+        
+        # Visualize production plan
+        st.plotly_chart(make_production_fig(prod_df), use_container_width=True)
+        
+        # Objective value
+        st.markdown("### 💰 Optimal Objective Value")
+        obj_type = "Profit" if sol["objective"] == "maximize" else "Cost"
+        st.metric(f"Total {obj_type}", f"${sol['objective_value']:,.2f}")
+        
+        # Resource utilization
+        st.markdown("### 📊 Resource Utilization")
+        
+        usage = pd.DataFrame.from_dict(sol["resource_usage"], orient="index")
+        used_vec = usage["used"].to_numpy(dtype=np.float64)
+        avail_vec = usage["available"].to_numpy(dtype=np.float64)
+        slack_vec = usage["slack"].to_numpy(dtype=np.float64)
+        binding_vec = usage["binding"].to_numpy(dtype=bool)
+        
+        resource_df = pd.DataFrame({
+            "Resource": usage.index,
+            "Used": used_vec,
+            "Available": avail_vec,
+            "Slack": slack_vec,
+            "Utilization %": np.divide(used_vec * 100, avail_vec, out=np.zeros_like(used_vec), where=avail_vec > 0),
+            "Status": np.where(binding_vec, "🔴 Binding", "🟢 Slack")
+        })
+        st.dataframe(
+            resource_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Used": st.column_config.NumberColumn(format="%.2f"),
+                "Available": st.column_config.NumberColumn(format="%.2f"),
+                "Slack": st.column_config.NumberColumn(format="%.2f"),
+                "Utilization %": st.column_config.NumberColumn(format="%.1f%%")
+            }
+        )
+        
+        # Visualize resource utilization
+        util_df = pd.DataFrame({
+            "Resource": np.repeat(usage.index.to_numpy(), 2),
+            "Type": np.tile(["Used", "Available"], len(usage)),
+            "Amount": np.column_stack([used_vec, slack_vec]).ravel()
+        })
+        st.plotly_chart(make_utilization_fig(util_df), use_container_width=True)
+        
+        # Shadow prices
+        st.markdown("### 💡 Shadow Prices (Marginal Values)")
+        
+        st.markdown("""
+        <div class="info-box">
+        <strong>What are Shadow Prices?</strong><br>
+        Shadow prices tell you how much the objective function would improve if you had one more unit of a resource.
+        Only binding constraints (fully utilized resources) have meaningful shadow prices.
+        </div>
+        """, unsafe_allow_html=True)
+        
+        prices = pd.Series(sol["shadow_prices"], dtype=np.float64)
+        effect = "increase profit" if sol["objective"] == "maximize" else "decrease cost"
+        shadow_df = pd.DataFrame({
+            "Resource": prices.index.str.replace("_", " "),
+            "Shadow Price": prices.to_numpy(),
+            "Interpretation": (f"Gaining 1 more unit would {effect} by $" + prices.abs().map("{:.2f}".format))
+                .where(prices.abs() > 0.01, "Not binding (has slack)")
+                .to_numpy()
+        })
+        st.dataframe(
+            shadow_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={"Shadow Price": st.column_config.NumberColumn(format="$%.2f")}
+        )
+        
+        # Download results
+        st.markdown("### 📥 Export Results")
+        
+        st.download_button(
+            label="📄 Download Report (TXT)",
+            data=build_report(
+                (sol["problem_name"], sol["objective"]),
+                (
+                    sol["status_text"],
+                    tuple(sol["variables"].items()),
+                    sol["objective_value"],
+                    tuple(
+                        (res, data["used"], data["available"], data["slack"], data["binding"])
+                        for res, data in sol["resource_usage"].items()
+                    ),
+                    tuple(sol["shadow_prices"].items())
+                )
+            ),
+            file_name=f"{sol['problem_name'].replace(' ', '_')}_solution.txt",
+            mime="text/plain"
+        )
+
+
+@st.cache_data
+def help_markdown():
+    """Return the static Help tab content."""
+    return """
+    ### 📖 Step-by-Step Guide
+    
+    #### 1️⃣ Configure Your Problem (Sidebar)
+    - Enter the **number of products** you want to produce
+    - Enter the **number of resources/constraints** you have
+    - Choose whether to **maximize** (profit) or **minimize** (cost)
+    - Select **continuous** (decimals) or **integer** (whole numbers) variables
+    
+    #### 2️⃣ Input Data (Input Data Tab)
+    - **Products**: Name each product and enter its profit (or cost) per unit
+    - **Resources**: Name each resource and enter how much is available
+    - **Usage Matrix**: Enter how much of each resource is needed per unit of each product
+    
+    #### 3️⃣ Solve (Solve Tab)
+    - Review your problem summary
+    - Click the "Solve Problem" button
+    - The app will find the optimal solution
+    
+    #### 4️⃣ Analyze Results (Results Tab)
+    - View the optimal production quantities
+    - See which resources are fully utilized (binding constraints)
+    - Understand shadow prices to identify valuable resources
+    - Download a complete report
+    
+    ---
+    
+    ### 📊 Understanding the Results
+    
+    #### Optimal Production Plan
+    This tells you how many units of each product to produce to achieve the best objective value.
+    
+    #### Resource Utilization
+    - **Used**: Amount of resource consumed by the optimal plan
+    - **Available**: Total amount of resource you have
+    - **Slack**: Unused resource (Available - Used)
+    - **Binding**: A resource with zero slack (fully utilized)
+    
+    #### Shadow Prices
+    The marginal value of having one more unit of a resource:
+    - **High shadow price** = Very valuable resource; getting more would significantly improve your objective
+    - **Zero shadow price** = Resource has slack; getting more won't help right now
+    - Only meaningful for binding constraints
+    
+    ---
+    
+    ### 💡 Tips for Success
+    
+    1. **Start with an example**: Click "Wyndor Glass Example" to see a working problem
+    2. **Check your data**: Make sure all numbers are non-negative
+    3. **Logical consistency**: Resource usage should make sense (e.g., if a product doesn't use a resource, enter 0)
+    4. **Units matter**: Make sure all your units are consistent (hours, dollars, etc.)
+    
+    ---
+    
+    ### ⚠️ Common Issues
+    
+    #### Infeasible Problem
+    Your constraints are too restrictive. Possible fixes:
+    - Increase resource availability
+    - Reduce resource usage requirements
+    - Check for contradictory constraints
+    
+    #### Unbounded Problem
+    Your solution can grow infinitely. Possible fixes:
+    - Add missing constraints
+    - Check that all necessary limitations are included
+    - Verify objective function is correct
+    
+    ---
+    
+    ### 🎓 For Students
+    
+    This tool helps you:
+    - ✅ Verify your hand calculations
+    - ✅ Explore "what-if" scenarios
+    - ✅ Understand sensitivity to changes
+    - ✅ Learn optimization concepts interactively
+    
+    **Remember**: The computer finds the optimal solution, but YOU need to:
+    - Formulate the problem correctly
+    - Interpret the results
+    - Make informed business decisions
+    
+    ---
+    
+    ### 📚 Example Problems
+    
+    Use the sidebar to load pre-configured examples:
+    - **Wyndor Glass**: Classic 2-product, 3-resource problem
+    - **Bakery**: Production planning with multiple constraints
+    
+    ---
+    
+    ### 🆘 Need Help?
+    
+    If you encounter issues:
+    1. Double-check all input values
+    2. Try loading an example problem first
+    3. Make sure resource usage values are realistic
+    4. Contact your instructor if problems persist
+    """
+
 
 # Title
 st.markdown('<div class="main-header">📊 Linear Programming: Product Mix Solver</div>', unsafe_allow_html=True)
@@ -92,6 +612,9 @@ with st.sidebar:
     # Variable type
     variable_type = st.radio("Variable Type", ["Continuous (Decimals OK)", "Integer (Whole Numbers Only)"])
     
+    # Solver
+    solver_choice = st.selectbox("Solver", ["HiGHS", "CBC"])
+    
     st.markdown("---")
     
     # Example problems
@@ -122,83 +645,91 @@ with tab1:
     st.markdown('<div class="section-header">Step 1: Define Products</div>', unsafe_allow_html=True)
     
     # Load example if requested
-    if 'load_example' in st.session_state:
-        if st.session_state.load_example == "wyndor":
-            num_products = 2
-            num_resources = 3
-            objective_type = "Maximize (Profit)"
-            variable_type = "Continuous (Decimals OK)"
-        elif st.session_state.load_example == "bakery":
-            num_products = 2
-            num_resources = 3
-            objective_type = "Maximize (Profit)"
-            variable_type = "Continuous (Decimals OK)"
-        del st.session_state.load_example
+    example = st.session_state.pop('load_example', None)
+    if example is not None:
+        # Keep the example as the table defaults on later reruns
+        st.session_state.active_example = example
+        for table in ("products_table", "resources_table", "usage_table"):
+            st.session_state.pop(table, None)
+        num_products = len(EXAMPLES[example]["product_names"])
+        num_resources = len(EXAMPLES[example]["resource_names"])
+        objective_type = "Maximize (Profit)"
+        variable_type = "Continuous (Decimals OK)"
+    active_example = st.session_state.get('active_example')
+    defaults = EXAMPLES[active_example]
     
     # Product names and profits
     st.markdown("#### Product Information")
-    col1, col2 = st.columns([2, 1])
     
-    products = {}
-    for i in range(num_products):
-        with col1:
-            if 'load_example' in st.session_state and st.session_state.load_example == "wyndor":
-                default_name = ["Doors", "Windows"][i] if i < 2 else f"Product_{i+1}"
-            elif 'load_example' in st.session_state and st.session_state.load_example == "bakery":
-                default_name = ["Cookies", "Cakes"][i] if i < 2 else f"Product_{i+1}"
-            else:
-                default_name = f"Product_{i+1}"
-            
-            prod_name = st.text_input(f"Product {i+1} Name", value=default_name, key=f"prod_name_{i}")
-        
-        with col2:
-            if objective_type == "Maximize (Profit)":
-                if 'load_example' in st.session_state and st.session_state.load_example == "wyndor":
-                    default_profit = float([300, 500][i]) if i < 2 else 100.0
-                elif 'load_example' in st.session_state and st.session_state.load_example == "bakery":
-                    default_profit = float([2, 8][i]) if i < 2 else 10.0
-                else:
-                    default_profit = 100.0
-                
-                profit = st.number_input(f"Profit per Unit ($)", value=default_profit, key=f"profit_{i}", min_value=0.0, step=10.0)
-            else:
-                cost = st.number_input(f"Cost per Unit ($)", value=50.0, key=f"cost_{i}", min_value=0.0, step=10.0)
-                profit = cost
-        
-        products[prod_name] = profit
+    default_names = [
+        defaults["product_names"][i] if i < len(defaults["product_names"]) else f"Product_{i+1}"
+        for i in range(num_products)
+    ]
+    is_max = objective_type == "Maximize (Profit)"
+    value_label = "Profit per Unit ($)" if is_max else "Cost per Unit ($)"
+    default_values = [default_coefficient(defaults, i, is_max) for i in range(num_products)]
+    
+    # Tables are seeded from their last edited state so resizing keeps the values already entered
+    edited_products = st.data_editor(
+        seed_table(
+            pd.DataFrame({"Product": default_names, "Value": default_values}),
+            st.session_state.get("products_table"),
+            ["Product", "Value"]
+        ),
+        key=f"coef_table_{num_products}_{active_example}",
+        num_rows="fixed",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Product": st.column_config.TextColumn("Product Name", required=True),
+            "Value": st.column_config.NumberColumn(value_label, min_value=0.0, step=10.0, required=True)
+        }
+    )
+    st.session_state.products_table = edited_products
+    products = dict(zip(
+        edited_products["Product"].fillna(pd.Series(default_names)),
+        edited_products["Value"].fillna(0.0).astype(float).tolist()
+    ))
+    product_names = list(products.keys())
     
     st.markdown('<div class="section-header">Step 2: Define Resources and Constraints</div>', unsafe_allow_html=True)
     
     # Resource names and capacities
     st.markdown("#### Resource Availability")
-    resources = {}
-    resource_names = []
     
-    for i in range(num_resources):
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            if 'load_example' in st.session_state and st.session_state.load_example == "wyndor":
-                default_res_name = ["Plant_1", "Plant_2", "Plant_3"][i] if i < 3 else f"Resource_{i+1}"
-            elif 'load_example' in st.session_state and st.session_state.load_example == "bakery":
-                default_res_name = ["Oven_Time", "Mixing_Time", "Ingredients"][i] if i < 3 else f"Resource_{i+1}"
-            else:
-                default_res_name = f"Resource_{i+1}"
-            
-            res_name = st.text_input(f"Resource {i+1} Name", value=default_res_name, key=f"res_name_{i}")
-        
-        with col2:
-            if 'load_example' in st.session_state and st.session_state.load_example == "wyndor":
-                default_avail = float([4, 12, 18][i]) if i < 3 else 100.0
-            elif 'load_example' in st.session_state and st.session_state.load_example == "bakery":
-                default_avail = float([40, 30, 50][i]) if i < 3 else 100.0
-            else:
-                default_avail = 100.0
-            
-            available = st.number_input(f"Available Amount", value=default_avail, key=f"avail_{i}", min_value=0.0, step=10.0)
-        
-        resources[res_name] = {"available": available, "usage": {}}
-        resource_names.append(res_name)
+    default_res_names = [
+        defaults["resource_names"][i] if i < len(defaults["resource_names"]) else f"Resource_{i+1}"
+        for i in range(num_resources)
+    ]
+    default_avails = [
+        float(defaults["available"][i]) if i < len(defaults["available"]) else 100.0
+        for i in range(num_resources)
+    ]
+    
+    edited_resources = st.data_editor(
+        seed_table(
+            pd.DataFrame({"Resource": default_res_names, "Available": default_avails}),
+            st.session_state.get("resources_table"),
+            ["Resource", "Available"]
+        ),
+        key=f"resources_table_{num_resources}_{active_example}",
+        num_rows="fixed",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Resource": st.column_config.TextColumn("Resource Name", required=True),
+            "Available": st.column_config.NumberColumn("Available Amount", min_value=0.0, step=10.0, required=True)
+        }
+    )
+    st.session_state.resources_table = edited_resources
+    resources = {
+        res_name: {"available": available, "usage": {}}
+        for res_name, available in zip(
+            edited_resources["Resource"].fillna(pd.Series(default_res_names)),
+            edited_resources["Available"].fillna(0.0).astype(float).tolist()
+        )
+    }
+    resource_names = list(resources.keys())
     
     st.markdown('<div class="section-header">Step 3: Resource Usage Matrix</div>', unsafe_allow_html=True)
     
@@ -209,55 +740,52 @@ with tab1:
     </div>
     """, unsafe_allow_html=True)
     
-    # Create usage matrix
-    usage_data = []
-    product_names = list(products.keys())
-    
-    # Load example data if needed
-    if 'load_example' in st.session_state and st.session_state.load_example == "wyndor":
-        example_usage = [
-            [1.0, 0.0],  # Plant 1
-            [0.0, 2.0],  # Plant 2
-            [3.0, 2.0]   # Plant 3
-        ]
-    elif 'load_example' in st.session_state and st.session_state.load_example == "bakery":
-        example_usage = [
-            [0.5, 2.0],    # Oven
-            [0.3, 1.0],    # Mixing
-            [0.2, 1.5]     # Ingredients
-        ]
-    else:
-        example_usage = [[0.0] * num_products for _ in range(num_resources)]
-    
-    for i, res_name in enumerate(resource_names):
-        row = []
-        cols = st.columns(num_products)
-        for j, prod_name in enumerate(product_names):
-            with cols[j]:
-                default_val = example_usage[i][j] if i < len(example_usage) and j < len(example_usage[i]) else 0.0
-                usage = st.number_input(
-                    f"{res_name} per {prod_name}",
-                    value=default_val,
-                    key=f"usage_{i}_{j}",
-                    min_value=0.0,
-                    step=0.5
-                )
-                resources[res_name]["usage"][prod_name] = usage
-                row.append(usage)
-        usage_data.append(row)
+    example_usage = defaults["usage"]
+    
+    # Columns and rows are positional so renaming a product or resource keeps its entered usage values;
+    # resource names are shown in a read-only column instead of the index
+    usage_columns = [f"product_{j}" for j in range(len(product_names))]
+    usage_df = pd.DataFrame(
+        [
+            [example_usage[i][j] if i < len(example_usage) and j < len(example_usage[i]) else 0.0 for j in range(len(product_names))]
+            for i in range(len(resource_names))
+        ],
+        columns=usage_columns
+    )
+    usage_df.insert(0, "Resource", resource_names)
+    edited_usage = st.data_editor(
+        seed_table(usage_df, st.session_state.get("usage_table"), usage_columns),
+        key=f"usage_matrix_{len(resource_names)}x{len(product_names)}_{active_example}",
+        num_rows="fixed",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Resource": st.column_config.TextColumn("Resource", disabled=True),
+            **{
+                column: st.column_config.NumberColumn(prod_name, min_value=0.0, step=0.5)
+                for column, prod_name in zip(usage_columns, product_names)
+            }
+        }
+    )
+    st.session_state.usage_table = edited_usage
     
-    # Display as DataFrame for clarity
-    st.markdown("#### 📋 Summary Table")
-    df = pd.DataFrame(usage_data, columns=product_names, index=resource_names)
-    st.dataframe(df, use_container_width=True)
+    # Create usage matrix
+    usage_data = edited_usage[usage_columns].fillna(0.0).astype(float).to_numpy().tolist()
+    for res_name, row in zip(resource_names, usage_data):
+        resources[res_name]["usage"] = dict(zip(product_names, row))
     
     # Store in session state
     st.session_state.config = {
         "problem_name": problem_name,
         "products": products,
         "resources": resources,
+        "product_names": tuple(products.keys()),
+        "resource_names": tuple(resources.keys()),
+        "profit_vec": np.array([products[p] for p in products], dtype=np.float64),
+        "usage_matrix": np.asarray(usage_data, dtype=np.float64),
         "objective": "maximize" if "Maximize" in objective_type else "minimize",
-        "variable_type": "Continuous" if "Continuous" in variable_type else "Integer"
+        "variable_type": "Continuous" if "Continuous" in variable_type else "Integer",
+        "solver": solver_choice
     }
     st.session_state.problem_configured = True
 
@@ -283,76 +811,14 @@ with tab2:
         if st.button("🚀 Solve Problem", type="primary", use_container_width=True):
             with st.spinner("Solving optimization problem..."):
                 config = st.session_state.config
-                
-                # Create problem
-                if config["objective"] == "maximize":
-                    problem = LpProblem(config["problem_name"], LpMaximize)
-                else:
-                    problem = LpProblem(config["problem_name"], LpMinimize)
-                
-                # Create variables
-                variables = {}
-                for product_name in config["products"].keys():
-                    variables[product_name] = LpVariable(
-                        product_name.replace(" ", "_"),
-                        lowBound=0,
-                        cat=config["variable_type"]
-                    )
-                
-                # Objective function
-                objective = lpSum([
-                    config["products"][product] * variables[product]
-                    for product in config["products"].keys()
-                ])
-                problem += objective, "Objective"
-                
-                # Constraints
-                for resource_name, resource_data in config["resources"].items():
-                    constraint = lpSum([
-                        resource_data["usage"].get(product, 0) * variables[product]
-                        for product in config["products"].keys()
-                    ])
-                    problem += constraint <= resource_data["available"], resource_name
-                
-                # Solve
-                status = problem.solve()
-                
-                # Store results
-                st.session_state.solution = {
-                    "status": status,
-                    "status_text": ['Not Solved', 'Optimal', 'Infeasible', 'Unbounded', 'Undefined'][status],
-                    "variables": {},
-                    "objective_value": None,
-                    "resource_usage": {},
-                    "shadow_prices": {},
-                    "problem": problem
-                }
-                
-                if status == 1:  # Optimal
-                    for product_name, var in variables.items():
-                        st.session_state.solution["variables"][product_name] = value(var)
-                    
-                    st.session_state.solution["objective_value"] = value(problem.objective)
-                    
-                    for resource_name, resource_data in config["resources"].items():
-                        used = sum(
-                            resource_data["usage"].get(product, 0) * st.session_state.solution["variables"][product]
-                            for product in config["products"].keys()
-                        )
-                        available = resource_data["available"]
-                        slack = available - used
-                        
-                        st.session_state.solution["resource_usage"][resource_name] = {
-                            "used": used,
-                            "available": available,
-                            "slack": slack,
-                            "binding": abs(slack) < 0.001
-                        }
-                    
-                    for name, constraint in problem.constraints.items():
-                        st.session_state.solution["shadow_prices"][name] = constraint.pi
-                
-                st.rerun()
+                st.session_state.solution = build_and_solve(freeze_config(config))
+            
+            # The Results tab is rendered later in this same run, so no rerun is needed
+            sol = st.session_state.solution
+            if sol["status"] == LpStatusOptimal:
+                st.success("✅ Solution ready — see the Results tab.")
+            else:
+                st.warning(f"⚠️ Status: {sol['status_text']} — see the Results tab.")
         
     else:
         st.warning("⚠️ Please configure the problem in the 'Input Data' tab first.")
@@ -361,137 +827,7 @@ with tab3:
     st.markdown('<div class="section-header">Solution Results</div>', unsafe_allow_html=True)
     
     if st.session_state.solution:
-        sol = st.session_state.solution
-        config = st.session_state.config
-        
-        # Status
-        if sol["status"] == 1:
-            st.markdown(f'<div class="success-box"><strong>✅ Status:</strong> {sol["status_text"]} Solution Found!</div>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<div class="warning-box"><strong>⚠️ Status:</strong> {sol["status_text"]}</div>', unsafe_allow_html=True)
-            if sol["status"] == 2:
-                st.error("The problem is **INFEASIBLE**. This means the constraints are too restrictive and no solution exists that satisfies all constraints.")
-            elif sol["status"] == 3:
-                st.error("The problem is **UNBOUNDED**. This means the objective function can grow infinitely. Check that all necessary constraints are included.")
-        
-        if sol["status"] == 1:
-            # Optimal production plan
-            st.markdown("### 🎯 Optimal Production Plan")
-            
-            prod_df = pd.DataFrame([
-                {"Product": prod, "Quantity": qty, "Unit Value": f"${config['products'][prod]:,.2f}"}
-                for prod, qty in sol["variables"].items()
-            ])
-            st.dataframe(prod_df, use_container_width=True, hide_index=True)
-            
-            # Visualize production plan
-            fig_prod = px.bar(
-                prod_df,
-                x="Product",
-                y="Quantity",
-                title="Production Quantities by Product",
-                labels={"Quantity": "Units to Produce"},
-                color="Quantity",
-                color_continuous_scale="Blues"
-            )
-            st.plotly_chart(fig_prod, use_container_width=True)
-            
-            # Objective value
-            st.markdown("### 💰 Optimal Objective Value")
-            obj_type = "Profit" if config["objective"] == "maximize" else "Cost"
-            st.metric(f"Total {obj_type}", f"${sol['objective_value']:,.2f}")
-            
-            # Resource utilization
-            st.markdown("### 📊 Resource Utilization")
-            
-            resource_df = pd.DataFrame([
-                {
-                    "Resource": res,
-                    "Used": f"{data['used']:.2f}",
-                    "Available": f"{data['available']:.2f}",
-                    "Slack": f"{data['slack']:.2f}",
-                    "Utilization %": f"{(data['used']/data['available']*100):.1f}%",
-                    "Status": "🔴 Binding" if data['binding'] else "🟢 Slack"
-                }
-                for res, data in sol["resource_usage"].items()
-            ])
-            st.dataframe(resource_df, use_container_width=True, hide_index=True)
-            
-            # Visualize resource utilization
-            util_data = []
-            for res, data in sol["resource_usage"].items():
-                util_data.append({"Resource": res, "Type": "Used", "Amount": data['used']})
-                util_data.append({"Resource": res, "Type": "Available", "Amount": data['slack']})
-            
-            util_df = pd.DataFrame(util_data)
-            fig_util = px.bar(
-                util_df,
-                x="Resource",
-                y="Amount",
-                color="Type",
-                title="Resource Utilization: Used vs. Slack",
-                barmode="stack",
-                color_discrete_map={"Used": "#1f77b4", "Available": "#d3d3d3"}
-            )
-            st.plotly_chart(fig_util, use_container_width=True)
-            
-            # Shadow prices
-            st.markdown("### 💡 Shadow Prices (Marginal Values)")
-            
-            st.markdown("""
-            <div class="info-box">
-            <strong>What are Shadow Prices?</strong><br>
-            Shadow prices tell you how much the objective function would improve if you had one more unit of a resource.
-            Only binding constraints (fully utilized resources) have meaningful shadow prices.
-            </div>
-            """, unsafe_allow_html=True)
-            
-            shadow_df = pd.DataFrame([
-                {
-                    "Resource": res.replace("_", " "),
-                    "Shadow Price": f"${price:.2f}",
-                    "Interpretation": f"Gaining 1 more unit would {'increase profit' if config['objective'] == 'maximize' else 'decrease cost'} by ${abs(price):.2f}" if abs(price) > 0.01 else "Not binding (has slack)"
-                }
-                for res, price in sol["shadow_prices"].items()
-            ])
-            st.dataframe(shadow_df, use_container_width=True, hide_index=True)
-            
-            # Download results
-            st.markdown("### 📥 Export Results")
-            
-            # Create comprehensive report
-            report = f"""
-LINEAR PROGRAMMING SOLUTION REPORT
-{'='*60}
-
-Problem: {config['problem_name']}
-Objective: {config['objective'].capitalize()} {'Profit' if config['objective'] == 'maximize' else 'Cost'}
-Status: {sol['status_text']}
-
-OPTIMAL PRODUCTION PLAN:
-{'-'*60}
-"""
-            for prod, qty in sol["variables"].items():
-                report += f"{prod}: {qty:.2f} units\n"
-            
-            report += f"\nOPTIMAL {'PROFIT' if config['objective'] == 'maximize' else 'COST'}: ${sol['objective_value']:,.2f}\n"
-            
-            report += f"\nRESOURCE UTILIZATION:\n{'-'*60}\n"
-            for res, data in sol["resource_usage"].items():
-                status = "[BINDING]" if data['binding'] else ""
-                report += f"{res}: {data['used']:.2f} / {data['available']:.2f} (Slack: {data['slack']:.2f}) {status}\n"
-            
-            report += f"\nSHADOW PRICES:\n{'-'*60}\n"
-            for res, price in sol["shadow_prices"].items():
-                if abs(price) > 0.01:
-                    report += f"{res}: ${price:.2f} per unit\n"
-            
-            st.download_button(
-                label="📄 Download Report (TXT)",
-                data=report,
-                file_name=f"{config['problem_name'].replace(' ', '_')}_solution.txt",
-                mime="text/plain"
-            )
+        render_results(st.session_state.solution)
     
     else:
         st.info("👈 Configure and solve the problem to see results here.")
@@ -499,114 +835,13 @@ OPTIMAL PRODUCTION PLAN:
 with tab4:
     st.markdown('<div class="section-header">How to Use This App</div>', unsafe_allow_html=True)
     
-    st.markdown("""
-    ### 📖 Step-by-Step Guide
-    
-    #### 1️⃣ Configure Your Problem (Sidebar)
-    - Enter the **number of products** you want to produce
-    - Enter the **number of resources/constraints** you have
-    - Choose whether to **maximize** (profit) or **minimize** (cost)
-    - Select **continuous** (decimals) or **integer** (whole numbers) variables
-    
-    #### 2️⃣ Input Data (Input Data Tab)
-    - **Products**: Name each product and enter its profit (or cost) per unit
-    - **Resources**: Name each resource and enter how much is available
-    - **Usage Matrix**: Enter how much of each resource is needed per unit of each product
-    
-    #### 3️⃣ Solve (Solve Tab)
-    - Review your problem summary
-    - Click the "Solve Problem" button
-    - The app will find the optimal solution
-    
-    #### 4️⃣ Analyze Results (Results Tab)
-    - View the optimal production quantities
-    - See which resources are fully utilized (binding constraints)
-    - Understand shadow prices to identify valuable resources
-    - Download a complete report
-    
-    ---
-    
-    ### 📊 Understanding the Results
-    
-    #### Optimal Production Plan
-    This tells you how many units of each product to produce to achieve the best objective value.
-    
-    #### Resource Utilization
-    - **Used**: Amount of resource consumed by the optimal plan
-    - **Available**: Total amount of resource you have
-    - **Slack**: Unused resource (Available - Used)
-    - **Binding**: A resource with zero slack (fully utilized)
-    
-    #### Shadow Prices
-    The marginal value of having one more unit of a resource:
-    - **High shadow price** = Very valuable resource; getting more would significantly improve your objective
-    - **Zero shadow price** = Resource has slack; getting more won't help right now
-    - Only meaningful for binding constraints
-    
-    ---
-    
-    ### 💡 Tips for Success
-    
-    1. **Start with an example**: Click "Wyndor Glass Example" to see a working problem
-    2. **Check your data**: Make sure all numbers are non-negative
-    3. **Logical consistency**: Resource usage should make sense (e.g., if a product doesn't use a resource, enter 0)
-    4. **Units matter**: Make sure all your units are consistent (hours, dollars, etc.)
-    
-    ---
-    
-    ### ⚠️ Common Issues
-    
-    #### Infeasible Problem
-    Your constraints are too restrictive. Possible fixes:
-    - Increase resource availability
-    - Reduce resource usage requirements
-    - Check for contradictory constraints
-    
-    #### Unbounded Problem
-    Your solution can grow infinitely. Possible fixes:
-    - Add missing constraints
-    - Check that all necessary limitations are included
-    - Verify objective function is correct
-    
-    ---
-    
-    ### 🎓 For Students
-    
-    This tool helps you:
-    - ✅ Verify your hand calculations
-    - ✅ Explore "what-if" scenarios
-    - ✅ Understand sensitivity to changes
-    - ✅ Learn optimization concepts interactively
-    
-    **Remember**: The computer finds the optimal solution, but YOU need to:
-    - Formulate the problem correctly
-    - Interpret the results
-    - Make informed business decisions
-    
-    ---
-    
-    ### 📚 Example Problems
-    
-    Use the sidebar to load pre-configured examples:
-    - **Wyndor Glass**: Classic 2-product, 3-resource problem
-    - **Bakery**: Production planning with multiple constraints
-    
-    ---
-    
-    ### 🆘 Need Help?
-    
-    If you encounter issues:
-    1. Double-check all input values
-    2. Try loading an example problem first
-    3. Make sure resource usage values are realistic
-    4. Contact your instructor if problems persist
-    """)
+    st.markdown(help_markdown())
 
 # Footer
 st.markdown("---")
 st.markdown("""
     <div style='text-align: center; color: #666; padding: 1rem;'>
     <p>📊 Linear Programming Web App | Built for Operations Management Students</p>
-    <p><small>Powered by Streamlit and PuLP</small></p>
+    <p><small>Powered by Streamlit, PuLP and SciPy</small></p>
     </div>
 """, unsafe_allow_html=True)